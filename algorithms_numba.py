@@ -0,0 +1,276 @@
+"""
+Numba-compiled pathfinding kernels.
+
+This module contains JIT-compiled versions of the pathfinding hot loops.
+The kernels work on a flattened uint8 grid where the position (row, col)
+is addressed as the node index row * cols + col, so every score lookup is
+a plain array index instead of a dictionary lookup on a tuple key.
+
+Numba is optional: when it is not installed the kernels still import and
+run as ordinary Python functions, and NUMBA_AVAILABLE is False so callers
+can fall back to their own implementation.
+"""
+
+from typing import List, Tuple
+import numpy as np
+
+try:
+    from numba import njit, types
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function uncompiled."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Step costs scaled by 1000 and rounded, so scores are integers: a
+# straight step costs 1 and a diagonal step roughly sqrt(2). The kernel
+# keeps them in int32, which fits_int32_scores checks for a given grid.
+_D1 = 1000
+_D2 = 1414
+# g_score of a node that has not been reached yet
+_UNREACHED = np.iinfo(np.int32).max
+
+def fits_int32_scores(rows: int, cols: int) -> bool:
+    """
+    Check whether every score of a search on a grid fits in int32.
+    
+    A path visits each cell at most once, so no g_score exceeds one
+    diagonal step per cell, and no heuristic exceeds one diagonal step per
+    row or column.
+    
+    Args:
+        rows: Number of rows in the grid
+        cols: Number of columns in the grid
+        
+    Returns:
+        True if the compiled kernel can search the grid without overflow
+    """
+    return (rows * cols + max(rows, cols)) * _D2 < int(_UNREACHED)
+
+# Row/column deltas of the 8 neighboring cells
+_NEIGHBOR_OFFSETS = np.array([[-1, -1], [-1, 0], [-1, 1],
+                              [0, -1], [0, 1],
+                              [1, -1], [1, 0], [1, 1]], dtype=np.int32)
+
+@njit(cache=True)
+def _heuristic(row: int, col: int, target_row: int, target_col: int) -> int:
+    """Octile distance between two cells."""
+    d_row = abs(row - target_row)
+    d_col = abs(col - target_col)
+    if d_row > d_col:
+        return _D1 * d_row + (_D2 - _D1) * d_col
+    return _D1 * d_col + (_D2 - _D1) * d_row
+
+@njit(cache=True)
+def _grow_heap(heap_f: np.ndarray, heap_node: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return copies of the heap arrays with twice the capacity."""
+    new_f = np.empty(heap_f.shape[0] * 2, np.int32)
+    new_node = np.empty(heap_node.shape[0] * 2, np.int32)
+    new_f[:heap_f.shape[0]] = heap_f
+    new_node[:heap_node.shape[0]] = heap_node
+    return new_f, new_node
+
+# The open set is a 4-ary heap: node i has children 4i+1 .. 4i+4. It is
+# half as deep as a binary heap, and the four 4-byte child keys of a node
+# usually sit in one cache line, so sift-down touches fewer lines.
+
+@njit(cache=True)
+def _heap_push(heap_f: np.ndarray, heap_node: np.ndarray,
+               size: int, f: int, node: int) -> int:
+    """Push (f, node) onto the 4-ary heap and return the new size."""
+    i = size
+    # Sift up: move parents down until the new entry fits
+    while i > 0:
+        parent = (i - 1) >> 2
+        if heap_f[parent] <= f:
+            break
+        heap_f[i] = heap_f[parent]
+        heap_node[i] = heap_node[parent]
+        i = parent
+    heap_f[i] = f
+    heap_node[i] = node
+    return size + 1
+
+@njit(cache=True)
+def _heap_pop(heap_f: np.ndarray, heap_node: np.ndarray, size: int) -> int:
+    """Remove the root of the 4-ary heap and return the new size."""
+    size -= 1
+    f = heap_f[size]
+    node = heap_node[size]
+    i = 0
+    # Sift down: move the smallest child up until the last entry fits
+    while True:
+        first = (i << 2) + 1
+        if first >= size:
+            break
+        if first + 3 < size:
+            # All four children exist: compare them in two pairs, then
+            # compare the winners
+            left = first if heap_f[first] <= heap_f[first + 1] else first + 1
+            right = first + 2 if heap_f[first + 2] <= heap_f[first + 3] else first + 3
+            child = left if heap_f[left] <= heap_f[right] else right
+        else:
+            child = first
+            for other in range(first + 1, size):
+                if heap_f[other] < heap_f[child]:
+                    child = other
+        child_f = heap_f[child]
+        if f <= child_f:
+            break
+        heap_f[i] = child_f
+        heap_node[i] = heap_node[child]
+        i = child
+    heap_f[i] = f
+    heap_node[i] = node
+    return size
+
+@njit(cache=True)
+def _nodes_to_positions(nodes: np.ndarray, cols: int) -> np.ndarray:
+    """Convert flat node indices into an (n, 2) array of (row, col)."""
+    positions = np.empty((nodes.shape[0], 2), np.int32)
+    for i in range(nodes.shape[0]):
+        positions[i, 0] = nodes[i] // cols
+        positions[i, 1] = nodes[i] % cols
+    return positions
+
+@njit(cache=True)
+def _trace_path(came_from: np.ndarray, start: int, target: int) -> np.ndarray:
+    """Follow came_from links back from the target and return the path's node indices."""
+    # Count the hops first so the path can be filled back to front
+    length = 1
+    node = target
+    while node != start:
+        node = came_from[node]
+        length += 1
+    path_nodes = np.empty(length, np.int32)
+    node = target
+    for i in range(length - 1, -1, -1):
+        path_nodes[i] = node
+        node = came_from[node]
+    return path_nodes
+
+# Explicit signatures make Numba compile (or load from the on-disk cache)
+# at import time, so the first search pays no JIT cost and later calls skip
+# type dispatch. astar_numba always passes a C-contiguous uint8 grid, which
+# is either writable or a read-only view such as a shared batch grid.
+if NUMBA_AVAILABLE:
+    _POSITIONS = types.Array(types.int32, 2, 'A')
+    _ASTAR_SIGNATURES = [
+        types.Tuple((_POSITIONS, _POSITIONS))(
+            types.Array(types.uint8, 2, 'C', readonly=readonly),
+            types.int32, types.int32, types.int32, types.int32)
+        for readonly in (False, True)
+    ]
+else:
+    _ASTAR_SIGNATURES = []
+
+@njit(_ASTAR_SIGNATURES, cache=True)
+def _astar_kernel(grid: np.ndarray,
+                  start_row: int, start_col: int,
+                  target_row: int, target_col: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Run A* on a uint8 grid.
+
+    Args:
+        grid: 2D C-contiguous uint8 array (0 for empty, non-zero for obstacle)
+        start_row, start_col: Starting position
+        target_row, target_col: Target position
+
+    Returns:
+        Tuple of (path, visited) as (n, 2) int32 arrays of (row, col);
+        the path is empty when the target cannot be reached
+    """
+    rows, cols = grid.shape
+    cells = grid.ravel()
+    start = start_row * cols + start_col
+    target = target_row * cols + target_col
+
+    g_score = np.full(rows * cols, _UNREACHED, np.int32)
+    came_from = np.full(rows * cols, -1, np.int32)
+    closed = np.zeros(rows * cols, np.bool_)
+    visited = np.empty(rows * cols, np.int32)
+    n_visited = 0
+
+    heap_f = np.empty(64, np.int32)
+    heap_node = np.empty(64, np.int32)
+    g_score[start] = 0
+    size = _heap_push(heap_f, heap_node, 0,
+                      _heuristic(start_row, start_col, target_row, target_col), start)
+
+    while size > 0:
+        # Once no queued entry can beat the cost already found to the
+        # target, that cost is optimal
+        if heap_f[0] >= g_score[target]:
+            break
+        current = heap_node[0]
+        size = _heap_pop(heap_f, heap_node, size)
+        # Skip stale entries left behind when a better score was pushed
+        if closed[current]:
+            continue
+
+        closed[current] = True
+        visited[n_visited] = current
+        n_visited += 1
+
+        row = current // cols
+        col = current - row * cols
+        for k in range(8):
+            d_row = _NEIGHBOR_OFFSETS[k, 0]
+            d_col = _NEIGHBOR_OFFSETS[k, 1]
+            new_row = row + d_row
+            new_col = col + d_col
+            if new_row < 0 or new_row >= rows or new_col < 0 or new_col >= cols:
+                continue
+            neighbor = new_row * cols + new_col
+            if cells[neighbor] != 0 or closed[neighbor]:
+                continue
+
+            step = _D2 if d_row != 0 and d_col != 0 else _D1
+            tentative_g_score = g_score[current] + step
+            if tentative_g_score < g_score[neighbor]:
+                g_score[neighbor] = tentative_g_score
+                came_from[neighbor] = current
+                if size == heap_f.shape[0]:
+                    heap_f, heap_node = _grow_heap(heap_f, heap_node)
+                size = _heap_push(heap_f, heap_node, size,
+                                  tentative_g_score + _heuristic(new_row, new_col,
+                                                                 target_row, target_col),
+                                  neighbor)
+
+    if g_score[target] == _UNREACHED:
+        return np.empty((0, 2), np.int32), _nodes_to_positions(visited[:n_visited], cols)
+    return (_nodes_to_positions(_trace_path(came_from, start, target), cols),
+            _nodes_to_positions(visited[:n_visited], cols))
+
+def _to_positions(positions: np.ndarray) -> List[Tuple[int, int]]:
+    """Convert an (n, 2) position array into a list of (row, col) tuples."""
+    return list(map(tuple, positions.tolist()))
+
+def astar_numba(grid: np.ndarray,
+                start: Tuple[int, int],
+                target: Tuple[int, int]) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+    """
+    Find a path with the compiled A* kernel.
+
+    Args:
+        grid: 2D numpy array representing the grid (0 for empty, 1 for obstacle)
+        start: Starting position (row, col)
+        target: Target position (row, col)
+
+    Returns:
+        Tuple containing:
+        - List of positions forming the path
+        - List of visited positions
+        
+    Raises:
+        ValueError: If the grid is too large for int32 scores
+    """
+    if not fits_int32_scores(*grid.shape):
+        raise ValueError(f"grid of shape {grid.shape} is too large for the int32 A* kernel")
+    grid_u8 = np.ascontiguousarray(grid, dtype=np.uint8)
+    path, visited = _astar_kernel(grid_u8, start[0], start[1], target[0], target[1])
+    return _to_positions(path), _to_positions(visited)
@@ -4,8 +4,8 @@ Main module for the pathfinding visualizer.
 This module contains the main function that runs the pathfinding visualizer.
 """
 
-from visualizer import PathfindingVisualizer
-
 if __name__ == "__main__":
+    # Imported here so importing this module does not load pygame
+    from visualizer import PathfindingVisualizer  # pylint: disable=import-outside-toplevel
     visualizer = PathfindingVisualizer()
     visualizer.run()
@@ -0,0 +1,11 @@
+"""
+Pytest configuration for the test suite.
+
+Puts the project root on the Python path so project modules are importable
+by their top-level names, matching how main.py imports them.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
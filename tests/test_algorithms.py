@@ -9,7 +9,8 @@ import os
 import sys
 import pytest
 import numpy as np
-from ..algorithms import AStar, Dijkstra, GreedyBFS
+from ..algorithms import (AStar, Dijkstra, GreedyBFS, BidirectionalAStar, JPS,
+                          find_paths_batch)
 
 # Add the project root directory to Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -193,3 +194,110 @@ def test_greedy_bfs_no_path(no_path_grid, start, target):
     path, _ = greedy.find_path(no_path_grid, start, target)
     # Empty list indicates no path found
     assert not path, "Path should be empty when no path is found"
+
+
+def test_bidirectional_astar_path(grid, start, target):
+    """Test bidirectional A* algorithm finds a valid path in empty grid."""
+    bidirectional = BidirectionalAStar()
+    path, _ = bidirectional.find_path(grid, start, target)
+
+    assert path is not None
+    assert path[0] == start
+    assert path[-1] == target
+    assert len(path) == 5
+
+    for i in range(len(path) - 1):
+        current = path[i]
+        next_pos = path[i + 1]
+        assert abs(current[0] - next_pos[0]) <= 1
+        assert abs(current[1] - next_pos[1]) <= 1
+
+def test_bidirectional_astar_with_obstacles(grid_with_obstacles, start, target):
+    """Test bidirectional A* algorithm finds a valid path around obstacles."""
+    bidirectional = BidirectionalAStar()
+    path, _ = bidirectional.find_path(grid_with_obstacles, start, target)
+
+    assert path is not None
+    assert path[0] == start
+    assert path[-1] == target
+    # Same length as the path A* finds around the obstacles
+    assert len(path) == len(AStar().find_path(grid_with_obstacles, start, target)[0])
+
+    for pos in path:
+        assert grid_with_obstacles[pos] == 0
+
+def test_bidirectional_astar_no_path(no_path_grid, start, target):
+    """Test bidirectional A* algorithm handles no valid path case."""
+    bidirectional = BidirectionalAStar()
+    path, _ = bidirectional.find_path(no_path_grid, start, target)
+    # Empty list indicates no path found
+    assert not path, "Path should be empty when no path is found"
+
+def test_bidirectional_astar_same_start_and_target(grid, start):
+    """Test bidirectional A* algorithm when start and target coincide."""
+    bidirectional = BidirectionalAStar()
+    path, _ = bidirectional.find_path(grid, start, start)
+
+    assert path == [start]
+
+def test_jps_path(grid, start, target):
+    """Test Jump Point Search algorithm finds a valid path in empty grid."""
+    jps = JPS()
+    path, visited = jps.find_path(grid, start, target)
+
+    assert path is not None
+    assert path[0] == start
+    assert path[-1] == target
+    assert len(path) == 5
+    # A single diagonal jump reaches the target from the start
+    assert visited == [start]
+
+    for i in range(len(path) - 1):
+        current = path[i]
+        next_pos = path[i + 1]
+        assert abs(current[0] - next_pos[0]) <= 1
+        assert abs(current[1] - next_pos[1]) <= 1
+
+def test_jps_with_obstacles(grid_with_obstacles, start, target):
+    """Test Jump Point Search algorithm finds a valid path around obstacles."""
+    jps = JPS()
+    path, _ = jps.find_path(grid_with_obstacles, start, target)
+
+    assert path is not None
+    assert path[0] == start
+    assert path[-1] == target
+    # Same length as the path A* finds around the obstacles
+    assert len(path) == len(AStar().find_path(grid_with_obstacles, start, target)[0])
+
+    for i in range(len(path) - 1):
+        assert abs(path[i][0] - path[i + 1][0]) <= 1
+        assert abs(path[i][1] - path[i + 1][1]) <= 1
+    for pos in path:
+        assert grid_with_obstacles[pos] == 0
+
+def test_jps_no_path(no_path_grid, start, target):
+    """Test Jump Point Search algorithm handles no valid path case."""
+    jps = JPS()
+    path, _ = jps.find_path(no_path_grid, start, target)
+    # Empty list indicates no path found
+    assert not path, "Path should be empty when no path is found"
+
+def test_find_paths_batch(grid_with_obstacles, start, target, alternate_start, alternate_target):
+    """Test batched A* queries return the same results as running them one by one."""
+    pairs = [(start, target), (alternate_start, alternate_target), (target, start)]
+    results = find_paths_batch(grid_with_obstacles, pairs, max_workers=2)
+
+    assert len(results) == len(pairs)
+    for (pair_start, pair_target), (path, _) in zip(pairs, results):
+        expected_path, _ = AStar().find_path(grid_with_obstacles, pair_start, pair_target)
+        assert path == expected_path
+
+@pytest.mark.parametrize("algorithm_class", [AStar, Dijkstra, GreedyBFS, BidirectionalAStar, JPS])
+def test_read_only_grid(algorithm_class, grid_with_obstacles, start, target):
+    """Test algorithms accept a read-only uint8 grid like the visualizer passes."""
+    grid_ro = grid_with_obstacles.astype(np.uint8)
+    grid_ro.setflags(write=False)
+    path, _ = algorithm_class().find_path(grid_ro, start, target)
+    expected_path, _ = algorithm_class().find_path(grid_with_obstacles, start, target)
+
+    assert path == expected_path
@@ -0,0 +1,69 @@
+"""
+Test module for the compiled pathfinding kernels.
+
+This module checks that the Numba kernels used by the algorithm classes
+return the same results as the pure Python implementations.
+"""
+
+import math
+import pytest
+import numpy as np
+from ..algorithms import AStar
+from ..algorithms_numba import astar_numba, fits_int32_scores
+
+def path_cost(path):
+    """Return the total cost of a path, counting diagonal steps as sqrt(2)."""
+    return sum(math.sqrt(2) if r0 != r1 and c0 != c1 else 1
+               for (r0, c0), (r1, c1) in zip(path, path[1:]))
+
+def create_random_grid(seed):
+    """Create a 30x30 grid with roughly 30% obstacles and free corners."""
+    rng = np.random.default_rng(seed)
+    grid_sc = (rng.random((30, 30)) < 0.3).astype(float)
+    grid_sc[0, 0] = 0
+    grid_sc[29, 29] = 0
+    return grid_sc
+
+@pytest.mark.parametrize("seed", range(5))
+def test_astar_kernel_matches_python(seed):
+    """Test compiled A* finds a path as short as the Python implementation."""
+    grid_sc = create_random_grid(seed)
+    kernel_path, _ = AStar(use_numba=True).find_path(grid_sc, (0, 0), (29, 29))
+    python_path, _ = AStar(use_numba=False).find_path(grid_sc, (0, 0), (29, 29))
+
+    assert bool(kernel_path) == bool(python_path)
+    if python_path:
+        assert kernel_path[0] == (0, 0)
+        assert kernel_path[-1] == (29, 29)
+        assert path_cost(kernel_path) == pytest.approx(path_cost(python_path))
+        for pos in kernel_path:
+            assert grid_sc[pos] == 0
+
+def test_astar_kernel_returns_tuples():
+    """Test compiled A* returns paths as lists of (row, col) tuples."""
+    path, visited = AStar(use_numba=True).find_path(np.zeros((5, 5)), (0, 0), (4, 4))
+
+    assert path == [(0, 0), (1, 1), (2, 2), (3, 3), (4, 4)]
+    assert all(isinstance(pos, tuple) for pos in visited)
+
+def test_astar_kernel_no_path():
+    """Test compiled A* handles no valid path case."""
+    grid_sc = np.zeros((5, 5))
+    grid_sc[2, :] = 1
+    path, visited = AStar(use_numba=True).find_path(grid_sc, (0, 0), (4, 4))
+
+    assert not path, "Path should be empty when no path is found"
+    # Every reachable cell above the wall is expanded
+    assert len(visited) == 10
+
+def test_astar_large_grid_uses_python_loop():
+    """Test A* skips the int32 kernel on grids whose scores could overflow it."""
+    # A path along the whole row would cost more than int32 can hold
+    grid_sc = np.zeros((1, 2_200_000), dtype=np.uint8)
+    assert fits_int32_scores(1000, 1000)
+    assert not fits_int32_scores(*grid_sc.shape)
+    with pytest.raises(ValueError):
+        astar_numba(grid_sc, (0, 0), (0, 10))
+
+    path, _ = AStar(use_numba=True).find_path(grid_sc, (0, 0), (0, 10))
+    assert path == [(0, col) for col in range(11)]
@@ -0,0 +1,47 @@
+"""
+Test module for the UI components.
+
+This module checks the checkbox rendering and the compiled cell
+classification that the visualizer uses to decide how every grid cell is
+drawn.
+"""
+
+# pylint: disable=no-member
+import numpy as np
+import pygame
+# Import by the top-level name, as the visualizer does, so the kernel's
+# on-disk cache records a module name that main.py can load
+from ui_components import (EMPTY, OBSTACLE, START, TARGET, VISITED, Checkbox,
+                           classify_cells)
+
+def test_checkbox_after_pygame_restart(monkeypatch):
+    """Test checkboxes still render after pygame is shut down and started again."""
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    try:
+        Checkbox(0, 0, (255, 0, 0), "A*").draw(pygame.Surface((200, 40)))
+    finally:
+        pygame.quit()
+
+    pygame.init()
+    try:
+        checkbox = Checkbox(0, 0, (255, 0, 0), "A*")
+        screen = pygame.Surface((200, 40))
+        checkbox.draw(screen)
+        # The label is drawn to the right of the box
+        assert screen.get_bounding_rect().width > checkbox.rect.width
+    finally:
+        pygame.quit()
+
+def test_classify_cells_precedence():
+    """Test obstacles win over start/target, which win over visited nodes."""
+    grid_sc = np.zeros((3, 3), dtype=np.uint8)
+    grid_sc[1, 1] = 1
+    visited_mask = np.ones((3, 3), dtype=bool)
+    state = classify_cells(grid_sc, visited_mask, True, (0, 0), (1, 1))
+
+    assert state[0, 0] == START
+    assert state[1, 1] == OBSTACLE
+    assert state[2, 2] == VISITED
+    assert classify_cells(grid_sc, visited_mask, False, (-1, -1), (-1, -1))[2, 2] == EMPTY
+    assert classify_cells(grid_sc, visited_mask, False, (-1, -1), (2, 2))[2, 2] == TARGET
@@ -5,11 +5,21 @@ This module provides UI components for the pathfinding visualizer:
 - Checkbox: For algorithm selection
 - TextRenderer: For rendering different types of text
 - GridRenderer: For rendering the grid and handling cell operations
+- classify_cells: For computing the display state of every cell
 """
 
-from typing import Tuple
+# pylint: disable=no-member
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
 import pygame
 
+# The optional Numba import is shared with the pathfinding kernels
+try:
+    from algorithms_numba import NUMBA_AVAILABLE, njit
+except ImportError:
+    from .algorithms_numba import NUMBA_AVAILABLE, njit
+
 class Checkbox:
     """
     A UI component for selecting algorithms.
@@ -31,6 +41,19 @@ class Checkbox:
         self.color = color
         self.name = name
         self.checked = False
+        # The font and label are created on the first draw, so a checkbox
+        # can be built before the font module is initialized
+        self._font: Optional[pygame.font.Font] = None
+        self._label_key = None
+        self._label_surf = None
+        self._label_pos = (self.rect.right + 5, self.rect.y)
+
+    def _render_label(self) -> None:
+        """Render the label surface for the current name and color."""
+        if self._font is None:
+            self._font = pygame.font.SysFont('Arial', 20)
+        self._label_key = (self.name, self.color)
+        self._label_surf = self._font.render(self.name, True, self.color)
 
     def draw(self, screen: pygame.Surface) -> None:
         """
@@ -42,8 +65,10 @@ class Checkbox:
         pygame.draw.rect(screen, self.color, self.rect, 2)
         if self.checked:
             pygame.draw.rect(screen, self.color, self.rect.inflate(-4, -4))
-        text = pygame.font.SysFont('Arial', 20).render(self.name, True, self.color)
-        screen.blit(text, (self.rect.right + 5, self.rect.y))
+        # The label is only re-rendered when its name or color changes
+        if self._label_key != (self.name, self.color):
+            self._render_label()
+        screen.blit(self._label_surf, self._label_pos)
 
     def handle_click(self, pos: Tuple[int, int]) -> bool:
         """
@@ -60,12 +85,35 @@ class Checkbox:
             return True
         return False
 
+@lru_cache(maxsize=256)
+def _render(font: pygame.font.Font,
+            text: str,
+            color: Tuple[int, int, int]) -> pygame.Surface:
+    """
+    Render text with a font, reusing the surface for repeated strings.
+    
+    Args:
+        font: Font to render with
+        text: The text to render
+        color: RGB color tuple for the text
+        
+    Returns:
+        Surface containing the rendered text; callers must not draw on it
+    """
+    surface = font.render(text, True, color)
+    # Match the display's pixel format once the window exists
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert_alpha()
+    return surface
+
 class TextRenderer:
     """
     Handles text rendering for the application.
     
     This class provides methods for rendering different types of text
     (titles, normal text, warnings) with appropriate fonts and positioning.
+    Rendered surfaces are cached, so text drawn every frame is only
+    rasterized once.
     """
     def __init__(self) -> None:
         """Initialize fonts for different text types."""
@@ -86,7 +134,7 @@ class TextRenderer:
         Returns:
             Tuple of (surface, rect) containing the rendered text and its position
         """
-        surface = self.title_font.render(text, True, color)
+        surface = _render(self.title_font, text, color)
         rect = surface.get_rect(center=(800//2, 50))
         return surface, rect
 
@@ -106,7 +154,7 @@ class TextRenderer:
         Returns:
             Tuple of (surface, rect) containing the rendered text and its position
         """
-        surface = self.normal_font.render(text, True, color)
+        surface = _render(self.normal_font, text, color)
         rect = surface.get_rect(center=(center_x, y))
         return surface, rect
 
@@ -122,7 +170,7 @@ class TextRenderer:
         Returns:
             Tuple of (surface, rect) containing the rendered text and its position
         """
-        surface = self.warning_font.render(text, True, color)
+        surface = _render(self.warning_font, text, color)
         rect = surface.get_rect(center=(800//2, 700))
         return surface, rect
 
@@ -133,18 +181,47 @@ class GridRenderer:
     This class manages the rendering of the grid and provides methods for
     converting between screen coordinates and grid coordinates.
     """
-    def __init__(self, window_size: int, grid_size: int) -> None:
+    def __init__(self,
+                 window_size: int,
+                 grid_size: int,
+                 cell_colors: Iterable[Tuple[int, int, int]] = ()) -> None:
         """
         Initialize the grid renderer.
         
         Args:
             window_size: Size of the window in pixels
             grid_size: Number of cells in each dimension
+            cell_colors: Colors whose cell surfaces are created up front
         """
         self.window_size = window_size
         self.grid_size = grid_size
         self.cell_size = window_size // grid_size
         self.grid_color = (40, 40, 40)  # Dark gray for grid lines
+        # Screen area of every cell, indexed [row][col], built once so the
+        # draw calls do not compute a position per cell
+        self._rects = [[pygame.Rect(col * self.cell_size, row * self.cell_size,
+                                    self.cell_size, self.cell_size)
+                        for col in range(grid_size)]
+                       for row in range(grid_size)]
+        self._cell_surfaces: Dict[Tuple[int, int, int], pygame.Surface] = {}
+        self._palette_tiles: Dict[tuple, np.ndarray] = {}
+        self._image_buffer: Optional[np.ndarray] = None
+
+        # The grid lines never change, so draw them once onto an overlay that
+        # is blitted over the cells. A run-length encoded colorkey makes the
+        # blit skip the transparent spans instead of blending every pixel.
+        self._lines_surface = pygame.Surface((window_size, window_size))
+        self._lines_surface.fill((0, 0, 0))
+        self._lines_surface.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+        # Draw vertical lines
+        for x in range(0, self.window_size + 1, self.cell_size):
+            pygame.draw.line(self._lines_surface, self.grid_color, (x, 0), (x, self.window_size))
+        # Draw horizontal lines
+        for y in range(0, self.window_size + 1, self.cell_size):
+            pygame.draw.line(self._lines_surface, self.grid_color, (0, y), (self.window_size, y))
+
+        for color in cell_colors:
+            self.get_cell_surface(color)
 
     def get_cell_from_pos(self, pos: Tuple[int, int]) -> Tuple[int, int]:
         """
@@ -157,32 +234,100 @@ class GridRenderer:
             (row, col) grid coordinates
         """
         x, y = pos
-        row = min(max(y // self.cell_size, 0), self.grid_size - 1)
-        col = min(max(x // self.cell_size, 0), self.grid_size - 1)
+        size = self.cell_size
+        last = self.grid_size - 1
+        # Conditional expressions avoid the min/max calls on every mouse event
+        row = y // size
+        row = 0 if row < 0 else last if row > last else row
+        col = x // size
+        col = 0 if col < 0 else last if col > last else col
         return row, col
 
-    def draw_cell(self,
-                  screen: pygame.Surface,
-                  row: int,
-                  col: int,
-                  color: Tuple[int, int, int]) -> None:
+    def draw_cells(self,
+                   screen: pygame.Surface,
+                   cells: Iterable[Tuple[int, int, Tuple[int, int, int]]]) -> List[pygame.Rect]:
         """
-        Draw a single cell in the grid.
+        Draw many cells with a single batched blit.
         
         Args:
             screen: Pygame surface to draw on
-            row: Grid row
-            col: Grid column
+            cells: Iterable of (row, col, color) tuples
+            
+        Returns:
+            The areas of the screen that were drawn
+        """
+        rects = self._rects
+        return screen.blits([(self.get_cell_surface(color), rects[row][col])
+                             for row, col, color in cells])
+
+    def draw_state_image(self,
+                         screen: pygame.Surface,
+                         state: np.ndarray,
+                         palette: Tuple[Tuple[int, int, int], ...]) -> None:
+        """
+        Draw every cell at once from a grid of palette indices.
+        
+        The cell pixels are assembled into one image with NumPy and copied
+        to the surface in a single call, which is much faster than blitting
+        each cell when most of the grid changes.
+        
+        Args:
+            screen: Pygame surface to draw on, exactly covering the grid
+            state: 2D array of (row, col) indices into palette
+            palette: RGB color tuples for each state index
+        """
+        # Tiles hold mapped pixel values, so they depend on the pixel format
+        key = (palette, screen.get_bitsize(), screen.get_masks())
+        tiles = self._palette_tiles.get(key)
+        if tiles is None:
+            # (n_colors, x, y) mapped pixels of each outlined cell surface
+            tiles = np.stack([
+                pygame.surfarray.map_array(
+                    screen, pygame.surfarray.array3d(self.get_cell_surface(color)))
+                for color in palette])
+            self._palette_tiles[key] = tiles
+        n, size = self.grid_size, self.cell_size
+        if self._image_buffer is None or self._image_buffer.dtype != tiles.dtype:
+            self._image_buffer = np.empty((n, size, n, size), tiles.dtype)
+        # tiles[state.T] is indexed (col, row, x, y); interleave the cell
+        # and pixel axes into the (x, y) layout that surfarray expects
+        np.copyto(self._image_buffer, tiles[state.T].transpose(0, 2, 1, 3))
+        pygame.surfarray.blit_array(screen, self._image_buffer.reshape(n * size, n * size))
+
+    def get_cell_surface(self, color: Tuple[int, int, int]) -> pygame.Surface:
+        """
+        Get a cell-sized surface filled with a color and outlined in the grid color.
+        
+        Surfaces are created once per color and reused for every cell. They
+        are filled and outlined when created, so drawing a cell is a plain
+        blit rather than two draw.rect calls.
+        
+        Args:
             color: RGB color tuple for the cell
+            
+        Returns:
+            Surface to blit at the cell's top-left corner
         """
-        rect = pygame.Rect(col * self.cell_size,
-                           row * self.cell_size,
-                           self.cell_size,
-                           self.cell_size)
-        # Draw cell background
-        pygame.draw.rect(screen, color, rect)
-        # Draw grid lines on top
-        pygame.draw.rect(screen, self.grid_color, rect, 1)
+        surface = self._cell_surfaces.get(color)
+        if surface is None:
+            surface = pygame.Surface((self.cell_size, self.cell_size))
+            # Draw cell background
+            surface.fill(color)
+            # Draw grid lines on top
+            pygame.draw.rect(surface, self.grid_color, surface.get_rect(), 1)
+            self._cell_surfaces[color] = surface
+        return surface
+
+    def convert_surfaces(self) -> None:
+        """
+        Convert the cached surfaces to the display's pixel format.
+        
+        Call once the display mode is set if the renderer was created before.
+        """
+        self._cell_surfaces = {color: surface.convert()
+                               for color, surface in self._cell_surfaces.items()}
+        self._lines_surface = self._lines_surface.convert()
+        self._lines_surface.set_colorkey((0, 0, 0), pygame.RLEACCEL)
 
     def draw_grid_lines(self, screen: pygame.Surface) -> None:
         """
@@ -191,9 +336,62 @@ class GridRenderer:
         Args:
             screen: Pygame surface to draw on
         """
-        # Draw vertical lines
-        for x in range(0, self.window_size + 1, self.cell_size):
-            pygame.draw.line(screen, self.grid_color, (x, 0), (x, self.window_size))
-        # Draw horizontal lines
-        for y in range(0, self.window_size + 1, self.cell_size):
-            pygame.draw.line(screen, self.grid_color, (0, y), (self.window_size, y))
+        screen.blit(self._lines_surface, (0, 0))
+
+# Display states returned by classify_cells, used as palette indices by
+# GridRenderer.draw_state_image
+EMPTY, OBSTACLE, START, TARGET, VISITED = range(5)
+
+# The visualizer's grid is a C-contiguous uint8 array, so the signature is
+# compiled (or loaded from the on-disk cache) at import instead of on the
+# first frame
+if NUMBA_AVAILABLE:
+    from numba import types
+    _POINT = types.UniTuple(types.int64, 2)
+    _CLASSIFY_SIGNATURES = [
+        types.Array(types.uint8, 2, 'C')(
+            types.Array(types.uint8, 2, 'C'), types.Array(types.boolean, 2, 'C'),
+            types.boolean, _POINT, _POINT)
+    ]
+else:
+    _CLASSIFY_SIGNATURES = []
+
+@njit(_CLASSIFY_SIGNATURES, cache=True)
+def classify_cells(grid: np.ndarray,
+                   visited_mask: np.ndarray,
+                   show_visited: bool,
+                   start: Tuple[int, int],
+                   target: Tuple[int, int]) -> np.ndarray:
+    """
+    Compute the display state of every cell in one pass.
+    
+    Obstacles take precedence over the start and target points, which
+    take precedence over visited nodes.
+    
+    Args:
+        grid: 2D uint8 array (0 for empty, 1 for obstacle)
+        visited_mask: 2D bool array of visited nodes
+        show_visited: Whether visited nodes are shown
+        start: Starting position (row, col), or (-1, -1) if not set
+        target: Target position (row, col), or (-1, -1) if not set
+        
+    Returns:
+        2D uint8 array of EMPTY, OBSTACLE, START, TARGET or VISITED
+    """
+    rows, cols = grid.shape
+    start_row, start_col = start
+    target_row, target_col = target
+    state = np.empty((rows, cols), np.uint8)
+    for i in range(rows):
+        for j in range(cols):
+            if grid[i, j] == 1:
+                state[i, j] = OBSTACLE
+            elif i == start_row and j == start_col:
+                state[i, j] = START
+            elif i == target_row and j == target_col:
+                state[i, j] = TARGET
+            elif show_visited and visited_mask[i, j]:
+                state[i, j] = VISITED
+            else:
+                state[i, j] = EMPTY
+    return state
@@ -6,14 +6,55 @@ different pathfinding algorithms (A*, Dijkstra's, and Greedy BFS).
 """
 
 # pylint: disable=no-member
-import time
-from typing import Dict, List, Optional, Tuple, Set
+import queue
+import threading
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pygame
 
 from algorithms import AStar, Dijkstra, GreedyBFS
-from ui_components import Checkbox, TextRenderer, GridRenderer
+from algorithms_numba import NUMBA_AVAILABLE
+from ui_components import (Checkbox, TextRenderer, GridRenderer,
+                           EMPTY, OBSTACLE, START, TARGET, VISITED, classify_cells)
+
+# Above this many changed cells, drawing the whole grid as one image is
+# cheaper than blitting the changed cells one by one
+FULL_REDRAW_CELLS = 200
+
+# Frame rate cap of the main loop and the visited-node animation
+FPS = 60
+
+# Event types the main loop reacts to; all others are blocked
+HANDLED_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN,
+                  pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION, pygame.WINDOWEXPOSED]
+
+def _run_search(algorithm: object,
+                grid: np.ndarray,
+                start: Tuple[int, int],
+                target: Tuple[int, int],
+                results: queue.Queue) -> None:
+    """
+    Run one search and put its outcome on a queue.
+    
+    This is the body of the worker thread started for each algorithm, so
+    the search is timed on its own, without the UI thread's work.
+    
+    Args:
+        algorithm: Pathfinding algorithm instance
+        grid: Grid to search, not modified while the search runs
+        start: Starting position (row, col)
+        target: Target position (row, col)
+        results: Queue that receives (path, visited, elapsed seconds), or
+            the exception raised by the search
+    """
+    try:
+        start_time = perf_counter()
+        path, visited = algorithm.find_path(grid, start, target)
+        results.put((path, visited, perf_counter() - start_time))
+    except Exception as error:  # pylint: disable=broad-except
+        results.put(error)
 
 class PathfindingVisualizer:
     """
@@ -27,12 +68,12 @@ class PathfindingVisualizer:
         """
         Initialize the pathfinding visualizer.
         
-        Sets up the pygame window, initializes components, and defines constants.
+        Initializes pygame, components, and defines constants. The window
+        itself is opened on first use by _ensure_display; until then drawing
+        goes to an offscreen surface.
         """
         # Initialize Pygame
         pygame.init()
-        self.screen = pygame.display.set_mode((800, 800))
-        pygame.display.set_caption("Pathfinding Visualizer - All Algorithms")
 
         # Constants
         self.window_size = 800
@@ -52,32 +93,93 @@ class PathfindingVisualizer:
             'GREEDY': (255, 192, 203)
         }
 
+        self.screen = pygame.Surface((self.window_size, self.window_size))
+        self._display_ready = False
+
         # Initialize components
         self.text_renderer = TextRenderer()
-        self.grid_renderer = GridRenderer(self.window_size, self.grid_size)
+        self.grid_renderer = GridRenderer(
+            self.window_size, self.grid_size,
+            [self.colors[name] for name in ('BACKGROUND', 'RED', 'GREEN', 'BLUE', 'YELLOW',
+                                            'ASTAR', 'DIJKSTRA', 'GREEDY')])
         self.initialize_checkboxes()
 
         # Initialize state variables
         self.drawing = False
-        self.grid = np.zeros((self.grid_size, self.grid_size))
+        # Last cell made an obstacle while dragging, so repeated motion
+        # events inside one cell are ignored
+        self._last_draw_cell: Optional[Tuple[int, int]] = None
+        self.grid = np.zeros((self.grid_size, self.grid_size), dtype=np.uint8)
         self.start: Optional[Tuple[int, int]] = None
         self.target: Optional[Tuple[int, int]] = None
         self.setting_start = True
-        self.paths: Dict[str, List[Tuple[int, int]]] = {}
-        self.visited: Set[Tuple[int, int]] = set()
+        # Each path is an (n, 2) int16 array of (row, col) positions
+        self.paths: Dict[str, np.ndarray] = {}
+        # _visited_mask[row, col] is True for nodes shown as visited
+        self._visited_mask = np.zeros((self.grid_size, self.grid_size), dtype=bool)
         self.visualizing = False
         self.show_visited = True
         self.max_visited_nodes = 1000
+        # The visited-node animation is spread over at most this many frames
+        self.animation_frames = 120
+        self.clock = pygame.time.Clock()
         self.current_algorithm = 0
+        # The results panel compares algorithms, so A* runs the same pure
+        # Python loop as the others rather than the compiled kernel
         self.algorithms = [
-            ("A*", AStar()),
+            ("A*", AStar(use_numba=False)),
             ("Dijkstra", Dijkstra()),
             ("Greedy BFS", GreedyBFS())
         ]
+        self._algo_colors = {
+            "A*": self.colors['ASTAR'],
+            "Dijkstra": self.colors['DIJKSTRA'],
+            "Greedy BFS": self.colors['GREEDY']
+        }
         self.execution_times: Dict[str, float] = {}
+        # Algorithms selected when the current visualization started
+        self._selected_algorithms: List[Tuple[str, object]] = []
         self.algorithm_complete = False
         self.show_start_screen = True
         self.show_warning = False
+        self._quit_requested = False
+        self._start_bg: Optional[pygame.Surface] = None
+        # Blits of the results panel, rebuilt when execution_times changes
+        self._results_panel: Optional[List[Tuple[pygame.Surface, pygame.Rect]]] = None
+        # Keep unhandled events out of the queue entirely. Mouse motion is
+        # only needed for drawing obstacles on the grid.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(HANDLED_EVENTS)
+        pygame.event.set_blocked(pygame.MOUSEMOTION)
+
+        # Cells are drawn onto a backing surface that keeps them between
+        # frames, so only cells whose state changed need to be redrawn
+        self._state_colors = (self.colors['BACKGROUND'], self.colors['RED'],
+                              self.colors['GREEN'], self.colors['BLUE'],
+                              self.colors['YELLOW'])
+        self._grid_surface = pygame.Surface((self.window_size, self.window_size))
+        # No cell matches this state, so the first frame draws every cell
+        self._prev_state = np.full((self.grid_size, self.grid_size), 255, np.uint8)
+        # Set when the screen no longer shows the grid, such as after the
+        # start screen was drawn, so the next draw_grid redraws all of it
+        self._screen_stale = True
+
+    def _ensure_display(self) -> None:
+        """
+        Open the window if it is not open yet.
+        
+        Surfaces created before the window existed are converted to its
+        pixel format so blitting them needs no per-pixel conversion.
+        """
+        if self._display_ready:
+            return
+        self.screen = pygame.display.set_mode((self.window_size, self.window_size))
+        pygame.display.set_caption("Pathfinding Visualizer - All Algorithms")
+        self._grid_surface = self._grid_surface.convert()
+        if self._start_bg is not None:
+            self._start_bg = self._start_bg.convert()
+        self.grid_renderer.convert_surfaces()
+        self._display_ready = True
 
     def initialize_checkboxes(self) -> None:
         """
@@ -101,20 +203,23 @@ class PathfindingVisualizer:
         Clears the grid, resets all algorithm states, and prepares for a new
         visualization session.
         """
-        self.grid = np.zeros((self.grid_size, self.grid_size))
+        self.grid = np.zeros((self.grid_size, self.grid_size), dtype=np.uint8)
         self.start = None
         self.target = None
         self.setting_start = True
         self.paths = {}
-        self.visited = set()
+        self._visited_mask[:] = False
         self.visualizing = False
         self.show_visited = True
         self.drawing = False
+        self._last_draw_cell = None
         self.current_algorithm = 0
         self.execution_times = {}
+        self._results_panel = None
         self.algorithm_complete = False
         self.show_start_screen = True
         self.show_warning = False
+        pygame.event.set_blocked(pygame.MOUSEMOTION)
 
     def get_selected_algorithms(self) -> List[Tuple[str, object]]:
         """
@@ -132,14 +237,39 @@ class PathfindingVisualizer:
         Draw the start screen with instructions.
         
         Renders the initial screen containing instructions, algorithm selection
-        checkboxes, and author information.
+        checkboxes, and author information. The static text is rendered once
+        into a background surface; only the checkboxes and the warning are
+        drawn each frame.
+        """
+        if self._start_bg is None:
+            self._start_bg = self._render_start_background()
+        self.screen.blit(self._start_bg, (0, 0))
+
+        # Draw checkboxes
+        for checkbox in self.checkboxes:
+            checkbox.draw(self.screen)
+
+        # Draw warning if needed
+        if self.show_warning:
+            warning_surface, warning_rect = self.text_renderer.render_warning(
+                "Please select at least one algorithm!", self.colors['RED'])
+            self.screen.blit(warning_surface, warning_rect)
+        self._screen_stale = True
+
+    def _render_start_background(self) -> pygame.Surface:
+        """
+        Render the static part of the start screen.
+        
+        Returns:
+            Surface with the background, title, instructions and author name
         """
-        self.screen.fill(self.colors['BACKGROUND'])
+        background = pygame.Surface((self.window_size, self.window_size))
+        background.fill(self.colors['BACKGROUND'])
 
         # Draw title
         title_surface, title_rect = self.text_renderer.render_title("Pathfinding Visualizer",
                                                                     self.colors['WHITE'])
-        self.screen.blit(title_surface, title_rect)
+        background.blit(title_surface, title_rect)
 
         # Draw instructions
         instructions = [
@@ -160,46 +290,55 @@ class PathfindingVisualizer:
             text_surface, text_rect = self.text_renderer.render_text(line,
                                                                      self.colors['WHITE'],
                                                                      self.window_size//2, y_offset)
-            self.screen.blit(text_surface, text_rect)
+            background.blit(text_surface, text_rect)
             y_offset += 30
 
-        # Draw checkboxes
-        for checkbox in self.checkboxes:
-            checkbox.draw(self.screen)
-
-        # Draw warning if needed
-        if self.show_warning:
-            warning_surface, warning_rect = self.text_renderer.render_warning(
-                "Please select at least one algorithm!", self.colors['RED'])
-            self.screen.blit(warning_surface, warning_rect)
-
         # Draw author name
         author_surface, author_rect = self.text_renderer.render_text(
             "Batuhan Biber", self.colors['WHITE'], self.window_size - 100, self.window_size - 20)
-        self.screen.blit(author_surface, author_rect)
+        background.blit(author_surface, author_rect)
+        return background
 
-    def draw_grid(self) -> None:
+    def draw_grid(self) -> Optional[List[pygame.Rect]]:
         """
         Draw the main grid and visualization.
         
         Renders the current state of the grid, including obstacles, start/end
-        points, visited nodes, and paths.
-        """
-        self.screen.fill(self.colors['BACKGROUND'])
-
-        # Draw grid cells
-        for i in range(self.grid_size):
-            for j in range(self.grid_size):
-                if self.grid[i][j] == 1:  # Obstacle
-                    self.grid_renderer.draw_cell(self.screen, i, j, self.colors['RED'])
-                elif self.start and (i, j) == self.start:
-                    self.grid_renderer.draw_cell(self.screen, i, j, self.colors['GREEN'])
-                elif self.target and (i, j) == self.target:
-                    self.grid_renderer.draw_cell(self.screen, i, j, self.colors['BLUE'])
-                elif self.show_visited and (i, j) in self.visited:
-                    self.grid_renderer.draw_cell(self.screen, i, j, self.colors['YELLOW'])
-                else:
-                    self.grid_renderer.draw_cell(self.screen, i, j, self.colors['BACKGROUND'])
+        points, visited nodes, and paths. When only some cells changed and
+        no paths are shown, just those cells are drawn on the screen, and
+        when nothing changed nothing is drawn.
+        
+        Returns:
+            The areas of the screen that changed, or None if the whole
+            screen was redrawn
+        """
+        # Redraw the cells whose state changed since the last frame
+        state = self.get_cell_states()
+        dirty = state != self._prev_state
+        n_dirty = np.count_nonzero(dirty)
+        if n_dirty > FULL_REDRAW_CELLS:
+            self.grid_renderer.draw_state_image(self._grid_surface, state,
+                                                self._state_colors)
+        elif n_dirty:
+            rows, cols = np.nonzero(dirty)
+            state_colors = self._state_colors
+            cells = [(i, j, state_colors[cell]) for i, j, cell in
+                     zip(rows.tolist(), cols.tolist(), state[rows, cols].tolist())]
+            self.grid_renderer.draw_cells(self._grid_surface, cells)
+        self._prev_state = state
+
+        if not (self._screen_stale or n_dirty):
+            # The screen, including any paths and results panel drawn over
+            # the grid, is still up to date
+            return []
+        if not (self._screen_stale or self.algorithm_complete
+                or n_dirty > FULL_REDRAW_CELLS):
+            # The rest of the screen is still up to date. Cell surfaces
+            # include their outline, so the grid lines stay intact.
+            return self.grid_renderer.draw_cells(self.screen, cells)
+
+        self._screen_stale = False
+        self.screen.blit(self._grid_surface, (0, 0))
 
         # Draw complete grid lines
         self.grid_renderer.draw_grid_lines(self.screen)
@@ -208,6 +347,59 @@ class PathfindingVisualizer:
         if self.algorithm_complete:
             self.draw_paths()
             self.draw_results_panel()
+        return None
+
+    def get_cell_states(self) -> np.ndarray:
+        """
+        Compute the display state of every cell.
+        
+        Obstacles take precedence over the start and target points, which
+        take precedence over visited nodes.
+        
+        Returns:
+            2D uint8 array of EMPTY, OBSTACLE, START, TARGET or VISITED
+        """
+        if NUMBA_AVAILABLE:
+            return classify_cells(self.grid, self._visited_mask, self.show_visited,
+                                  self.start or (-1, -1), self.target or (-1, -1))
+
+        state = np.zeros((self.grid_size, self.grid_size), np.uint8)
+        if self.show_visited:
+            state[self._visited_mask] = VISITED
+        if self.target:
+            state[self.target] = TARGET
+        if self.start:
+            state[self.start] = START
+        state[self.grid == 1] = OBSTACLE
+        return state
+
+    def draw_visited(self, nodes: List[Tuple[int, int]]) -> List[pygame.Rect]:
+        """
+        Mark nodes as visited and draw only their cells.
+        
+        The cells are drawn on both the backing grid surface and the screen,
+        so the next draw_grid sees them as already up to date.
+        
+        Args:
+            nodes: Positions (row, col) of the newly visited nodes
+            
+        Returns:
+            The areas of the screen that were drawn
+        """
+        if not nodes:
+            return []
+        rows, cols = np.array(nodes).T
+        self._visited_mask[rows, cols] = True
+        if not self.show_visited:
+            return []
+        # Obstacles, the start and the target keep their own color
+        new = self._prev_state[rows, cols] == EMPTY
+        rows, cols = rows[new], cols[new]
+        self._prev_state[rows, cols] = VISITED
+        color = self.colors['YELLOW']
+        cells = [(i, j, color) for i, j in zip(rows.tolist(), cols.tolist())]
+        self.grid_renderer.draw_cells(self._grid_surface, cells)
+        return self.grid_renderer.draw_cells(self.screen, cells)
 
     def draw_paths(self) -> None:
         """
@@ -218,11 +410,9 @@ class PathfindingVisualizer:
         """
         for name, _ in self.algorithms:
             if name in self.paths:
-                color = (self.colors['ASTAR'] if name == "A*"
-                        else self.colors['DIJKSTRA'] if name == "Dijkstra"
-                        else self.colors['GREEDY'])
-                for pos in self.paths[name]:
-                    self.grid_renderer.draw_cell(self.screen, pos[0], pos[1], color)
+                color = self._algo_colors[name]
+                self.grid_renderer.draw_cells(
+                    self.screen, [(row, col, color) for row, col in self.paths[name].tolist()])
 
     def draw_results_panel(self) -> None:
         """
@@ -231,21 +421,37 @@ class PathfindingVisualizer:
         Renders a panel showing the execution time for each algorithm that
         has completed its pathfinding.
         """
+        if self._results_panel is None:
+            self._results_panel = self._build_results_panel()
+        self.screen.blits(self._results_panel, doreturn=False)
+
+    def _build_results_panel(self) -> List[Tuple[pygame.Surface, pygame.Rect]]:
+        """
+        Build the blits that draw the results panel.
+        
+        The panel only changes when an algorithm finishes, so the blits are
+        built once per change instead of every frame. The text is blitted
+        over the translucent background on the screen rather than baked into
+        it, which keeps the antialiased edges blended the same way.
+        
+        Returns:
+            List of (surface, rect) pairs to blit in order
+        """
         panel_surface = pygame.Surface((200, 150), pygame.SRCALPHA)
+        if self._display_ready:
+            panel_surface = panel_surface.convert_alpha()
         panel_surface.fill(self.colors['TEXT_BG'])
-        self.screen.blit(panel_surface, (self.window_size - 210, 10))
+        blits = [(panel_surface, panel_surface.get_rect(topleft=(self.window_size - 210, 10)))]
 
         y_offset = 20
         for name, _ in self.algorithms:
             if name in self.execution_times:
-                color = (self.colors['ASTAR'] if name == "A*"
-                        else self.colors['DIJKSTRA'] if name == "Dijkstra"
-                        else self.colors['GREEDY'])
+                color = self._algo_colors[name]
                 text = f"{name}: {self.execution_times[name]:.3f}s"
-                text_surface, text_rect = self.text_renderer.render_text(
-                    text, color, self.window_size - 110, y_offset)
-                self.screen.blit(text_surface, text_rect)
+                blits.append(self.text_renderer.render_text(
+                    text, color, self.window_size - 110, y_offset))
                 y_offset += 30
+        return blits
 
     def handle_mouse(self, event: pygame.event.Event) -> None:
         """
@@ -260,29 +466,42 @@ class PathfindingVisualizer:
                     checkbox.handle_click(event.pos)
             return
 
+        if event.type == pygame.MOUSEBUTTONUP:
+            if event.button == 1:
+                self.drawing = False
+            return
+
+        # Motion events arrive at the mouse polling rate, so positions off
+        # the grid are ignored before any cell lookup
         pos = pygame.mouse.get_pos()
+        extent = self.grid_renderer.cell_size * self.grid_size
+        if not (0 <= pos[0] < extent and 0 <= pos[1] < extent):
+            return
         row, col = self.grid_renderer.get_cell_from_pos(pos)
 
         if event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left click
                 if (row, col) != self.start and (row, col) != self.target:
                     self.drawing = True
-                    self.grid[row][col] = 1 - self.grid[row][col]
+                    self._last_draw_cell = None
+                    self.grid[row, col] ^= 1
             elif event.button == 3:  # Right click
-                if self.grid[row][col] == 0:
+                if self.grid[row, col] == 0:
                     if self.setting_start:
                         self.start = (row, col)
                         self.setting_start = False
                     else:
                         self.target = (row, col)  # Just set the target, don't start visualization
 
-        elif event.type == pygame.MOUSEBUTTONUP:
-            if event.button == 1:
-                self.drawing = False
-
         elif event.type == pygame.MOUSEMOTION:
-            if self.drawing and (row, col) != self.start and (row, col) != self.target:
-                self.grid[row][col] = 1
+            cell = (row, col)
+            # Skip the write when the drag has not left the last cell or
+            # the cell already is an obstacle
+            if cell == self._last_draw_cell or self.grid[row, col] == 1:
+                return
+            if self.drawing and cell != self.start and cell != self.target:
+                self.grid[row, col] = 1
+                self._last_draw_cell = cell
 
     def start_visualization(self) -> None:
         """
@@ -291,13 +510,18 @@ class PathfindingVisualizer:
         Initializes the visualization process by resetting paths and visited
         nodes, and starting the first selected algorithm.
         """
+        self._ensure_display()
+        # Paths from a previous run are still drawn on the screen
+        self._screen_stale = True
         self.visualizing = True
         self.paths = {}
-        self.visited = set()
+        self._visited_mask[:] = False
         self.show_visited = True
         self.current_algorithm = 0
         self.execution_times = {}
+        self._results_panel = None
         self.algorithm_complete = False
+        self._selected_algorithms = self.get_selected_algorithms()
         self.find_path()
 
     def find_path(self) -> None:
@@ -305,43 +529,108 @@ class PathfindingVisualizer:
         Execute the selected algorithms and visualize their paths.
         
         Runs each selected algorithm in sequence, visualizing their progress
-        and storing their results.
+        and storing their results. Window events are polled throughout, and
+        a quit request stops the run early.
         """
         if not (self.start and self.target and not self.algorithm_complete):
             return
 
-        selected_algorithms = self.get_selected_algorithms()
-        if not selected_algorithms:
-            self.algorithm_complete = True
-            self.visualizing = False
-            return
+        # One read-only snapshot of the grid is shared by every search in
+        # this run; algorithms needing scratch space allocate their own
+        grid = self.grid.copy()
+        grid.setflags(write=False)
 
-        name, algorithm = selected_algorithms[self.current_algorithm]
+        selected_algorithms = self._selected_algorithms
+        while self.current_algorithm < len(selected_algorithms):
+            name, algorithm = selected_algorithms[self.current_algorithm]
+            visited = self._run_one(name, algorithm, grid)
+            if visited is None or not self._animate_visited(visited):
+                break
+            self.current_algorithm += 1
 
-        # Time and execute algorithm
-        start_time = time.time()
-        path, visited = algorithm.find_path(self.grid, self.start, self.target)
-        end_time = time.time()
+        self.algorithm_complete = True
+        self.visualizing = False
+        # The next frame draws the paths and results panel over the grid
+        self._screen_stale = True
+
+    def _run_one(self,
+                 name: str,
+                 algorithm: object,
+                 grid: np.ndarray) -> Optional[List[Tuple[int, int]]]:
+        """
+        Run one algorithm and store its path and execution time.
+        
+        The search runs in a worker thread, while this thread keeps polling
+        window events.
+        
+        Args:
+            name: Algorithm name
+            algorithm: Pathfinding algorithm instance
+            grid: Read-only snapshot of the grid to search
+            
+        Returns:
+            The visited nodes, or None if quitting was requested first
+        """
+        results: queue.Queue = queue.Queue()
+        worker = threading.Thread(target=_run_search,
+                                  args=(algorithm, grid, self.start, self.target, results),
+                                  daemon=True)
+        worker.start()
+        worker.join(1 / FPS)
+        while worker.is_alive():
+            if not self._pump_events():
+                return None
+            worker.join(1 / FPS)
+        outcome = results.get()
+        if isinstance(outcome, Exception):
+            raise outcome
+        path, visited, elapsed = outcome
 
         # Store results
-        self.execution_times[name] = end_time - start_time
-        self.paths[name] = path
-
-        # Animate visited nodes
-        self.visited = set()
-        for node in visited[:self.max_visited_nodes]:
-            self.visited.add(node)
-            self.draw_grid()
-            pygame.display.flip()
-            time.sleep(0.01)
-
-        # Move to next algorithm
-        self.current_algorithm += 1
-        if self.current_algorithm >= len(selected_algorithms):
-            self.algorithm_complete = True
-            self.visualizing = False
-        else:
-            self.find_path()
+        self.execution_times[name] = elapsed
+        self._results_panel = None
+        self.paths[name] = np.asarray(path, dtype=np.int16).reshape(-1, 2)
+        return visited
+
+    def _animate_visited(self, visited: List[Tuple[int, int]]) -> bool:
+        """
+        Animate visited nodes, revealing a batch of them per frame.
+        
+        Only the new cells are drawn and pushed to the display.
+        
+        Args:
+            visited: Visited nodes in the order they were expanded
+            
+        Returns:
+            False if quitting was requested during the animation
+        """
+        # Draw the grid once without visited nodes
+        self._visited_mask[:] = False
+        self.draw_grid()
+        pygame.display.flip()
+
+        shown = visited[:self.max_visited_nodes]
+        nodes_per_frame = max(1, -(-len(shown) // self.animation_frames))
+        for i in range(0, len(shown), nodes_per_frame):
+            self.clock.tick(FPS)
+            if not self._pump_events():
+                return False
+            pygame.display.update(self.draw_visited(shown[i:i + nodes_per_frame]))
+        return True
+
+    def _pump_events(self) -> bool:
+        """
+        Process window events while a visualization is running.
+        
+        Quit requests are taken off the queue and remembered; other events
+        stay queued for the main loop.
+        
+        Returns:
+            False if quitting was requested
+        """
+        if pygame.event.get(pygame.QUIT):
+            self._quit_requested = True
+        return not self._quit_requested
 
     def run(self) -> None:
         """
@@ -350,10 +639,10 @@ class PathfindingVisualizer:
         Handles events, updates the display, and manages the visualization
         state.
         """
-        clock = pygame.time.Clock()
+        self._ensure_display()
         running = True
 
-        while running:
+        while running and not self._quit_requested:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
@@ -362,6 +651,7 @@ class PathfindingVisualizer:
                         if self.show_start_screen:
                             if self.get_selected_algorithms():
                                 self.show_start_screen = False
+                                pygame.event.set_allowed(pygame.MOUSEMOTION)
                             else:
                                 self.show_warning = True
                         elif not self.visualizing and self.start and self.target:
@@ -372,13 +662,20 @@ class PathfindingVisualizer:
                                     pygame.MOUSEBUTTONUP,
                                     pygame.MOUSEMOTION):
                     self.handle_mouse(event)
+                elif event.type == pygame.WINDOWEXPOSED:
+                    # The window contents may have been lost
+                    self._screen_stale = True
 
             if self.show_start_screen:
                 self.draw_start_screen()
+                pygame.display.flip()
             else:
-                self.draw_grid()
-
-            pygame.display.flip()
-            clock.tick(60)
+                # Only present what changed; an idle grid presents nothing
+                dirty_rects = self.draw_grid()
+                if dirty_rects is None:
+                    pygame.display.flip()
+                elif dirty_rects:
+                    pygame.display.update(dirty_rects)
+            self.clock.tick(FPS)
 
         pygame.quit()